@@ -16,12 +16,12 @@ class Handler(http.server.SimpleHTTPRequestHandler):
 
 
 def main():
-    os.chdir(DIRECTORY)
-    with http.server.HTTPServer(("", PORT), Handler) as httpd:
+    with http.server.ThreadingHTTPServer(("", PORT), Handler) as httpd:
         url = f"http://localhost:{PORT}"
         print(f"Serving map tester at {url}")
         print("Press Ctrl+C to stop")
-        webbrowser.open(url)
+        if not os.getenv("MAP_TESTER_NO_OPEN"):
+            webbrowser.open(url)
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -25,9 +25,9 @@ class CORSSettings(BaseModel):
     @staticmethod
     def from_env_string(cors_origins: str = "") -> "CORSSettings":
         """Parse CORS origins from comma-separated environment variable."""
-        if not cors_origins or cors_origins == "":
+        origins = [o for o in map(str.strip, cors_origins.split(",")) if o]
+        if not origins:
             return CORSSettings()
-        origins = [o.strip() for o in cors_origins.split(",")]
         return CORSSettings(allowed_origins=origins)
 
 
@@ -43,6 +43,10 @@ def get_settings() -> AppSettings:
     """
     Get application settings from environment variables.
 
+    The first call loads `.env` through python-dotenv (variables already set in
+    the environment win) and builds the settings; later calls reuse them. Call
+    `get_settings.cache_clear()` to rebuild.
+
     Returns:
         AppSettings instance
 
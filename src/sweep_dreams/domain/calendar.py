@@ -1,5 +1,6 @@
-import calendar
-from datetime import datetime, timedelta
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from sweep_dreams.domain.models import (
@@ -13,9 +14,16 @@ from sweep_dreams.domain.models import (
 )
 
 
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+@lru_cache(maxsize=4096)
 def _nth_weekday(year: int, month: int, weekday: int, occurrence: int) -> int | None:
     """Return the day of the month for the nth occurrence of a weekday."""
-    first_weekday, days_in_month = calendar.monthrange(year, month)
+    first_weekday = date(year, month, 1).weekday()
+    days_in_month = _DAYS_IN_MONTH[month - 1]
+    if month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+        days_in_month += 1  # Leap year.
     day = 1 + ((weekday - first_weekday) % 7) + 7 * (occurrence - 1)
     return day if day <= days_in_month else None
 
@@ -23,6 +31,8 @@ def _nth_weekday(year: int, month: int, weekday: int, occurrence: int) -> int |
 def _normalize_now(now: datetime | None, tz: ZoneInfo) -> datetime:
     if now is None:
         return datetime.now(tz)
+    if now.tzinfo is tz:
+        return now
     if now.tzinfo is None:
         return now.replace(tzinfo=tz)
     return now.astimezone(tz)
@@ -49,15 +59,59 @@ def next_sweep_window_from_rule(
 
     # Get active weeks (None means all weeks 1-5)
     active_weeks = (
-        sorted(rule.pattern.weeks_of_month)
+        tuple(sorted(rule.pattern.weeks_of_month))
         if rule.pattern.weeks_of_month
-        else [1, 2, 3, 4, 5]
+        else (1, 2, 3, 4, 5)
     )
     if not active_weeks:
         raise ValueError("Rule has no active weeks configured.")
 
-    start_hour = rule.time_window.start.hour
-    end_hour = rule.time_window.end.hour
+    # Windows start and end on whole hours, so the answer is the same for every
+    # reference time within one wall-clock hour: cache per hour.
+    return _next_window_in_hour(
+        weekday,
+        active_weeks,
+        rule.time_window.start.hour,
+        rule.time_window.end.hour,
+        tzinfo,
+        reference.replace(minute=0, second=0, microsecond=0),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _next_window_in_hour(
+    weekday: int,
+    active_weeks: tuple[int, ...],
+    start_hour: int,
+    end_hour: int,
+    tzinfo: ZoneInfo,
+    reference: datetime,
+) -> tuple[datetime, datetime]:
+    return _scan_monthly_windows(
+        weekday, active_weeks, start_hour, end_hour, tzinfo, reference
+    )
+
+
+def _scan_monthly_windows(
+    weekday: int,
+    active_weeks: Sequence[int],
+    start_hour: int,
+    end_hour: int,
+    tzinfo: ZoneInfo,
+    reference: datetime,
+) -> tuple[datetime, datetime]:
+    """
+    Return the first window that has not ended by reference, within 12 months.
+
+    Candidates are compared as whole wall-clock hours since the proleptic
+    ordinal epoch, which matches comparing datetimes that share reference's
+    tzinfo. Only the winning candidate is turned into datetimes.
+    """
+    reference_hour = reference.toordinal() * 24 + reference.hour
+    start_time = time(start_hour, tzinfo=tzinfo)
+    end_time = time(end_hour, tzinfo=tzinfo)
+    crosses_midnight = end_hour <= start_hour
+    end_offset = end_hour + 24 if crosses_midnight else end_hour
 
     for month_offset in range(0, 13):
         month_index = reference.month - 1 + month_offset
@@ -67,22 +121,34 @@ def next_sweep_window_from_rule(
         for occurrence in active_weeks:
             day = _nth_weekday(year, month, weekday, occurrence)
             if day is None:
-                continue
-
-            start_dt = datetime(year, month, day, start_hour, tzinfo=tzinfo)
-            end_dt = datetime(year, month, day, end_hour, tzinfo=tzinfo)
-            if end_dt <= start_dt:
-                end_dt += timedelta(days=1)  # Handle windows that cross midnight.
+                break  # Occurrences ascend, so later ones overflow the month too.
 
-            if end_dt <= reference:
+            candidate = date(year, month, day)
+            if candidate.toordinal() * 24 + end_offset <= reference_hour:
                 continue  # Window already passed.
 
-            if start_dt <= reference <= end_dt or start_dt > reference:
-                return start_dt, end_dt
+            start_dt = datetime.combine(candidate, start_time)
+            end_dt = datetime.combine(candidate, end_time)
+            if crosses_midnight:
+                end_dt += timedelta(days=1)
+            return start_dt, end_dt
 
     raise ValueError("Unable to compute next sweep window within 12 months.")
 
 
+@lru_cache(maxsize=64)
+def _resolve_weekday(label: str) -> Weekday:
+    """Map a dataset weekday label (e.g. " Tues") to a Weekday."""
+    weekday_label = label.strip().lower()
+    if weekday_label == "holiday":
+        raise ValueError(
+            "Schedule applies only on holidays; next sweeping day is not defined."
+        )
+    if weekday_label not in _WEEKDAY_LOOKUP:
+        raise ValueError(f"Unknown weekday label: {label!r}")
+    return _WEEKDAY_LOOKUP[weekday_label]
+
+
 def next_sweep_window(
     schedule: SweepingSchedule,
     *,
@@ -95,16 +161,9 @@ def next_sweep_window(
     tzinfo = tz or PACIFIC_TZ
     reference = _normalize_now(now, tzinfo)
 
-    weekday_label = (schedule.week_day or "").strip().lower()
-    if weekday_label == "holiday":
-        raise ValueError(
-            "Schedule applies only on holidays; next sweeping day is not defined."
-        )
-    if weekday_label not in _WEEKDAY_LOOKUP:
-        raise ValueError(f"Unknown weekday label: {schedule.week_day!r}")
-    weekday = _WEEKDAY_LOOKUP[weekday_label]
+    weekday = _resolve_weekday(schedule.week_day or "")
 
-    active_weeks = [
+    active_weeks = sorted(
         idx
         for idx, active in enumerate(
             [
@@ -117,34 +176,46 @@ def next_sweep_window(
             start=1,
         )
         if bool(active)
-    ]
+    )
     if not active_weeks:
         raise ValueError("Schedule has no active weeks configured.")
     if schedule.from_hour is None or schedule.to_hour is None:
         raise ValueError("Schedule is missing from/to hours.")
 
-    for month_offset in range(0, 13):
-        month_index = reference.month - 1 + month_offset
-        year = reference.year + month_index // 12
-        month = (month_index % 12) + 1
+    return _scan_monthly_windows(
+        weekday,
+        active_weeks,
+        schedule.from_hour,
+        schedule.to_hour,
+        tzinfo,
+        reference,
+    )
 
-        for occurrence in sorted(active_weeks):
-            day = _nth_weekday(year, month, weekday, occurrence)
-            if day is None:
-                continue
 
-            start_dt = datetime(year, month, day, schedule.from_hour, tzinfo=tzinfo)
-            end_dt = datetime(year, month, day, schedule.to_hour, tzinfo=tzinfo)
-            if end_dt <= start_dt:
-                end_dt += timedelta(days=1)  # Handle windows that cross midnight.
+def _rule_day_bounds(rule: RecurringRule, reference: datetime) -> tuple[int, int]:
+    """
+    Return (weekday offset, lower bound) in days from the reference date for a rule.
 
-            if end_dt <= reference:
-                continue  # Window already passed.
+    The weekday offset is when the rule's weekday next occurs (0-6). The lower
+    bound never exceeds the real offset of its next window: it is the same,
+    except a window crossing midnight may still be running from yesterday (-1).
+    """
+    if not rule.pattern.weekdays:
+        return 0, 0  # Invalid rule: let next_sweep_window_from_rule raise and skip it.
+    # Same weekday choice as next_sweep_window_from_rule.
+    weekday = next(iter(rule.pattern.weekdays))
+    offset = (weekday - reference.weekday()) % 7
+    if offset == 6 and rule.time_window.end <= rule.time_window.start:
+        return offset, -1
+    return offset, offset
 
-            if start_dt <= reference <= end_dt or start_dt > reference:
-                return start_dt, end_dt
 
-    raise ValueError("Unable to compute next sweep window within 12 months.")
+def _day_start(
+    reference_date: date, days: int, tzinfo: ZoneInfo, hour: int = 0
+) -> datetime:
+    """Return the given hour of the day `days` after reference_date."""
+    day = reference_date + timedelta(days=days)
+    return datetime(day.year, day.month, day.day, hour, tzinfo=tzinfo)
 
 
 def earliest_sweep_window(
@@ -167,12 +238,43 @@ def earliest_sweep_window(
     Raises:
         ValueError: If no valid sweep windows can be computed
     """
+    tzinfo = tz or PACIFIC_TZ
+    reference = _normalize_now(now, tzinfo)
+    reference_date = reference.date()
+
     earliest_start = None
     earliest_end = None
 
-    for rule in block_schedule.rules:
+    # Visit rules in weekday order so the scan can stop as soon as no remaining
+    # rule can beat the best window found so far. Rules sharing a weekday keep
+    # their original order (sorted() is stable), which preserves tie-breaking.
+    bounded_rules = sorted(
+        ((_rule_day_bounds(rule, reference), rule) for rule in block_schedule.rules),
+        key=lambda item: item[0][0],
+    )
+    # remaining_bounds[i]: lowest day bound among rules i and later.
+    remaining_bounds = [bounds[1] for bounds, _ in bounded_rules]
+    for index in range(len(remaining_bounds) - 2, -1, -1):
+        remaining_bounds[index] = min(
+            remaining_bounds[index], remaining_bounds[index + 1]
+        )
+
+    for index, ((_, day_bound), rule) in enumerate(bounded_rules):
+        if earliest_start is not None:
+            floor = _day_start(reference_date, remaining_bounds[index], tzinfo)
+            if floor >= earliest_start:
+                break
+            # This rule's window starts no earlier than its start hour on its bound
+            # day: later rules may still win, but this one cannot.
+            start_hour = rule.time_window.start.hour
+            rule_floor = _day_start(reference_date, day_bound, tzinfo, start_hour)
+            if rule_floor >= earliest_start:
+                continue
+
         try:
-            start, end = next_sweep_window_from_rule(rule=rule, now=now, tz=tz)
+            start, end = next_sweep_window_from_rule(
+                rule=rule, now=reference, tz=tzinfo
+            )
         except ValueError:
             # Skip rules that can't compute windows (e.g., holiday-only)
             continue
@@ -218,7 +320,26 @@ def earliest_sweep_window_with_block_id(
     earliest_end: datetime | None = None
     earliest_block_sweep_id: int | None = None
 
-    for schedule in source_schedules:
+    # Schedules with the same weekday, hours and weeks share their next window:
+    # compute it once per group, using the first schedule with the group's lowest
+    # block_sweep_id. Visiting those in list order keeps the original tie-breaking.
+    representatives: dict[tuple, tuple[int, SweepingSchedule]] = {}
+    for position, schedule in enumerate(source_schedules):
+        key = (
+            schedule.week_day,
+            schedule.from_hour,
+            schedule.to_hour,
+            schedule.week1,
+            schedule.week2,
+            schedule.week3,
+            schedule.week4,
+            schedule.week5,
+        )
+        current = representatives.get(key)
+        if current is None or schedule.block_sweep_id < current[1].block_sweep_id:
+            representatives[key] = (position, schedule)
+
+    for _, schedule in sorted(representatives.values(), key=lambda item: item[0]):
         try:
             start, end = next_sweep_window(schedule, now=reference, tz=tzinfo)
         except ValueError:
@@ -247,37 +368,21 @@ def earliest_sweep_window_with_block_id(
     return earliest_start, earliest_end, earliest_block_sweep_id
 
 
-# Mapping for parking regulation day ranges
-_DAYS_TO_WEEKDAYS: dict[str, set[Weekday]] = {
-    "m-f": {Weekday.MON, Weekday.TUE, Weekday.WED, Weekday.THU, Weekday.FRI},
-    "m-sa": {
-        Weekday.MON,
-        Weekday.TUE,
-        Weekday.WED,
-        Weekday.THU,
-        Weekday.FRI,
-        Weekday.SAT,
-    },
-    "m-su": {
-        Weekday.MON,
-        Weekday.TUE,
-        Weekday.WED,
-        Weekday.THU,
-        Weekday.FRI,
-        Weekday.SAT,
-        Weekday.SUN,
-    },
-    "sa-su": {Weekday.SAT, Weekday.SUN},
-    "su": {Weekday.SUN},
-    "sa": {Weekday.SAT},
+# Mapping for parking regulation day ranges, as weekday bitmasks: bit N is set
+# when Weekday(N) is active (bit 0 = Monday ... bit 6 = Sunday).
+_DAYS_TO_WEEKDAYS: dict[str, int] = {
+    "m-f": 0b0011111,
+    "m-sa": 0b0111111,
+    "m-su": 0b1111111,
+    "sa-su": 0b1100000,
+    "su": 0b1000000,
+    "sa": 0b0100000,
 }
 
 
 def _parse_military_time(military: int) -> tuple[int, int]:
     """Parse military time (e.g., 800 -> (8, 0), 1800 -> (18, 0))."""
-    hours = military // 100
-    minutes = military % 100
-    return hours, minutes
+    return divmod(military, 100)
 
 
 def next_parking_regulation_window(
@@ -319,33 +424,23 @@ def next_parking_regulation_window(
     start_hour, start_min = _parse_military_time(regulation.hrs_begin)
     end_hour, end_min = _parse_military_time(regulation.hrs_end)
 
+    start_time = time(start_hour, start_min, tzinfo=tzinfo)
+    end_time = time(end_hour, end_min, tzinfo=tzinfo)
+    crosses_midnight = (end_hour, end_min) <= (start_hour, start_min)
+    reference_date = reference.date()
+
     # Search up to 8 days ahead (covers all weekdays)
     for day_offset in range(8):
-        candidate_date = reference.date() + timedelta(days=day_offset)
-        candidate_weekday = Weekday(candidate_date.weekday())
+        candidate_date = reference_date + timedelta(days=day_offset)
 
-        if candidate_weekday not in active_weekdays:
+        if not active_weekdays >> candidate_date.weekday() & 1:
             continue
 
-        start_dt = datetime(
-            candidate_date.year,
-            candidate_date.month,
-            candidate_date.day,
-            start_hour,
-            start_min,
-            tzinfo=tzinfo,
-        )
-        end_dt = datetime(
-            candidate_date.year,
-            candidate_date.month,
-            candidate_date.day,
-            end_hour,
-            end_min,
-            tzinfo=tzinfo,
-        )
+        start_dt = datetime.combine(candidate_date, start_time)
+        end_dt = datetime.combine(candidate_date, end_time)
 
         # Handle windows that cross midnight
-        if end_dt <= start_dt:
+        if crosses_midnight:
             end_dt += timedelta(days=1)
 
         # Skip if window has already passed
@@ -402,6 +497,7 @@ def compute_move_deadline(
     start_hour, start_min = _parse_military_time(regulation.hrs_begin)
     end_hour, end_min = _parse_military_time(regulation.hrs_end)
     hour_limit = regulation.hour_limit
+    start_time = time(start_hour, start_min, tzinfo=tzinfo)
 
     def find_next_regulated_day(from_dt: datetime, include_today: bool) -> datetime:
         """Find the start of the next regulation window."""
@@ -410,41 +506,20 @@ def compute_move_deadline(
             search_date += timedelta(days=1)
 
         for _ in range(8):
-            weekday = Weekday(search_date.weekday())
-            if weekday in active_weekdays:
-                return datetime(
-                    search_date.year,
-                    search_date.month,
-                    search_date.day,
-                    start_hour,
-                    start_min,
-                    tzinfo=tzinfo,
-                )
+            if active_weekdays >> search_date.weekday() & 1:
+                return datetime.combine(search_date, start_time)
             search_date += timedelta(days=1)
 
         raise ValueError("Could not find a regulated day within 8 days")
 
     # Get today's window times
     parked_date = parked_at.date()
-    parked_weekday = Weekday(parked_date.weekday())
-    is_regulated_day = parked_weekday in active_weekdays
+    is_regulated_day = bool(active_weekdays >> parked_date.weekday() & 1)
 
     if is_regulated_day:
-        window_start = datetime(
-            parked_date.year,
-            parked_date.month,
-            parked_date.day,
-            start_hour,
-            start_min,
-            tzinfo=tzinfo,
-        )
-        window_end = datetime(
-            parked_date.year,
-            parked_date.month,
-            parked_date.day,
-            end_hour,
-            end_min,
-            tzinfo=tzinfo,
+        window_start = datetime.combine(parked_date, start_time)
+        window_end = datetime.combine(
+            parked_date, time(end_hour, end_min, tzinfo=tzinfo)
         )
         # Handle windows that cross midnight
         if window_end <= window_start:
@@ -1,8 +1,44 @@
 """Human-readable formatting functions for domain models."""
 
+from functools import lru_cache
+
 from sweep_dreams.domain.models import Weekday, RecurringRule, BlockSchedule
 
 
+_WEEKDAY_NAMES: dict[Weekday, str] = {
+    Weekday.MON: "Monday",
+    Weekday.TUE: "Tuesday",
+    Weekday.WED: "Wednesday",
+    Weekday.THU: "Thursday",
+    Weekday.FRI: "Friday",
+    Weekday.SAT: "Saturday",
+    Weekday.SUN: "Sunday",
+}
+
+_ORDINAL_NAMES: dict[int, str] = {
+    1: "1st",
+    2: "2nd",
+    3: "3rd",
+    4: "4th",
+    5: "5th",
+}
+
+# AM/PM labels indexed by hour of day (0 -> "12am", 13 -> "1pm").
+_HOUR_LABELS: tuple[str, ...] = tuple(
+    f"{(hour % 12) or 12}{'am' if hour < 12 else 'pm'}" for hour in range(24)
+)
+
+
+def _rule_format_key(rule: RecurringRule) -> tuple:
+    weeks = rule.pattern.weeks_of_month
+    return (
+        frozenset(rule.pattern.weekdays),
+        frozenset(weeks) if weeks is not None else None,
+        rule.time_window.start.hour,
+        rule.time_window.end.hour,
+    )
+
+
 def rule_to_human(rule: RecurringRule) -> str:
     """
     Convert a RecurringRule to a human-readable string.
@@ -13,60 +49,34 @@ def rule_to_human(rule: RecurringRule) -> str:
     Returns:
         Human-readable string like "Every 2nd, 4th Monday at 12pm-2pm"
     """
-    weekday_names = {
-        Weekday.MON: "Monday",
-        Weekday.TUE: "Tuesday",
-        Weekday.WED: "Wednesday",
-        Weekday.THU: "Thursday",
-        Weekday.FRI: "Friday",
-        Weekday.SAT: "Saturday",
-        Weekday.SUN: "Sunday",
-    }
-
-    ordinal_names = {
-        1: "1st",
-        2: "2nd",
-        3: "3rd",
-        4: "4th",
-        5: "5th",
-    }
+    return _format_rule(*_rule_format_key(rule))
 
+
+@lru_cache(maxsize=1024)
+def _format_rule(
+    weekdays: frozenset[Weekday],
+    weeks_of_month: frozenset[int] | None,
+    start_hour: int,
+    end_hour: int,
+) -> str:
     # Format weeks_of_month if it's a subset
     weeks_prefix = ""
-    if rule.pattern.weeks_of_month is not None and rule.pattern.weeks_of_month != {
-        1,
-        2,
-        3,
-        4,
-        5,
-    }:
-        weeks_sorted = sorted(rule.pattern.weeks_of_month)
+    if weeks_of_month is not None and weeks_of_month != {1, 2, 3, 4, 5}:
+        weeks_sorted = sorted(weeks_of_month)
         if len(weeks_sorted) == 1:
-            weeks_prefix = f"{ordinal_names[weeks_sorted[0]]} "
+            weeks_prefix = f"{_ORDINAL_NAMES[weeks_sorted[0]]} "
         else:
-            week_names = [ordinal_names[w] for w in weeks_sorted]
+            week_names = [_ORDINAL_NAMES[w] for w in weeks_sorted]
             if len(week_names) == 2:
                 weeks_prefix = f"{week_names[0]} and {week_names[1]} "
             else:
                 weeks_prefix = f"{', '.join(week_names[:-1])}, and {week_names[-1]} "
 
-    weekdays_sorted = sorted(rule.pattern.weekdays)
-    weekday_str = ", ".join(weekday_names[w] for w in weekdays_sorted)
-
-    # Convert military time to AM/PM format
-    def format_hour(hour: int) -> str:
-        if hour == 0:
-            return "12am"
-        elif hour < 12:
-            return f"{hour}am"
-        elif hour == 12:
-            return "12pm"
-        else:
-            return f"{hour - 12}pm"
+    weekdays_sorted = sorted(weekdays)
+    weekday_str = ", ".join(_WEEKDAY_NAMES[w] for w in weekdays_sorted)
 
-    t = rule.time_window
-    start_str = format_hour(t.start.hour)
-    end_str = format_hour(t.end.hour)
+    start_str = _HOUR_LABELS[start_hour]
+    end_str = _HOUR_LABELS[end_hour]
 
     return f"Every {weeks_prefix}{weekday_str} at {start_str}-{end_str}"
 
@@ -3,7 +3,7 @@ from typing import Any
 from zoneinfo import ZoneInfo
 from enum import IntEnum
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
@@ -117,7 +117,9 @@ class ParkingRegulation(BaseModel):
                 and isinstance(v[0], (tuple, list))
                 and isinstance(v[0][0], (int, float))
             ):
-                return [tuple(map(float, coord[:2])) for coord in v if len(coord) >= 2]
+                return [
+                    (float(coord[0]), float(coord[1])) for coord in v if len(coord) >= 2
+                ]
             return []
 
         return []
@@ -161,7 +163,9 @@ class SweepingSchedule(BaseModel):
 
         # The GeoJSON field arrives as a list of [lon, lat] pairs.
         if isinstance(v, list):
-            return [tuple(map(float, coord[:2])) for coord in v if len(coord) >= 2]
+            return [
+                (float(coord[0]), float(coord[1])) for coord in v if len(coord) >= 2
+            ]
 
         # Fallback for WKT-like strings (e.g., "LINESTRING (lon lat, lon lat)")
         if isinstance(v, str):
@@ -179,3 +183,8 @@ class SweepingSchedule(BaseModel):
             return coords
 
         return v
+
+
+# Validates a whole list of schedules in one pydantic-core call. Shared by the
+# GeoJSON parser and the Supabase repository.
+SCHEDULE_LIST_ADAPTER = TypeAdapter(list[SweepingSchedule])
@@ -1,6 +1,9 @@
+import json
 import os
 import time
-from typing import Any, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Iterable, Iterator
 
 import requests
 from dotenv import load_dotenv
@@ -14,6 +17,13 @@ from sweep_dreams.parsing.geojson import parse_schedules
 
 URL = "https://data.sfgov.org/resource/yhqp-riqs.geojson"
 
+# Concurrent upsert requests; each batch is an independent round-trip.
+UPSERT_WORKERS = 4
+# Rows per upsert request (override with UPSERT_BATCH). Larger batches mean
+# fewer round-trips; batches whose JSON body exceeds the cap are split.
+DEFAULT_UPSERT_BATCH = 5000
+MAX_UPSERT_PAYLOAD_BYTES = 5_000_000
+
 
 def get_session() -> requests.Session:
     """Create a requests session with retries/backoff for transient failures."""
@@ -111,10 +121,65 @@ def fetch_data(url: str, page_limit: int | None = None) -> dict[str, Any] | None
     return combined_data
 
 
-def chunked(iterable: list[Any], size: int) -> Iterable[list[Any]]:
-    """Yield successive chunks from a list."""
-    for i in range(0, len(iterable), size):
-        yield iterable[i : i + size]
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield successive chunks from an iterable, consuming it lazily."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def split_oversized(
+    batch: list[dict[str, Any]], max_bytes: int = MAX_UPSERT_PAYLOAD_BYTES
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield the batch in consecutive parts whose JSON body stays under max_bytes.
+
+    Each row is serialized once; json.dumps joins list items with ", " inside
+    "[]", so a part's body size follows from its row sizes. A single row larger
+    than max_bytes is still sent on its own.
+    """
+    part: list[dict[str, Any]] = []
+    part_bytes = 2
+    for row in batch:
+        row_bytes = len(json.dumps(row))
+        added = row_bytes + (2 if part else 0)
+        if part and part_bytes + added > max_bytes:
+            yield part
+            part, part_bytes, added = [], 2, row_bytes
+        part.append(row)
+        part_bytes += added
+    if part:
+        yield part
+
+
+def upsert_batches(
+    client: Client,
+    table: str,
+    batches: Iterable[list[dict[str, Any]]],
+    max_workers: int = UPSERT_WORKERS,
+) -> None:
+    """Upsert batches concurrently, keeping at most max_workers requests in flight.
+
+    Batches are pulled from the iterable only as slots free up, so a lazy
+    iterable stays lazy. The first failed upsert is re-raised.
+    """
+
+    # The client builds its PostgREST sub-client lazily on first use; resolve the
+    # table here so worker threads never race to create it.
+    table_query = client.table(table)
+
+    def upsert(batch: list[dict[str, Any]]) -> None:
+        table_query.upsert(batch).execute()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: set[Future[None]] = set()
+        for batch in batches:
+            if len(in_flight) >= max_workers:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+            in_flight.add(executor.submit(upsert, batch))
+        for future in in_flight:
+            future.result()
 
 
 def schedule_to_record(schedule: SweepingSchedule) -> dict[str, Any]:
@@ -140,8 +205,14 @@ if __name__ == "__main__":
     table = os.environ.get("SUPABASE_TABLE")
     supabase: Client = create_client(url, key)
 
-    # Upsert in chunks to keep payload sizes reasonable for ~37k rows
-    for batch in chunked(
-        [schedule_to_record(address) for address in address_data], 1000
-    ):
-        supabase.table(table).upsert(batch).execute()
+    # Upsert in chunks to keep payload sizes reasonable for ~37k rows. Records
+    # are built per batch, so only the batches in flight are held in memory.
+    batch_size = int(os.environ.get("UPSERT_BATCH", DEFAULT_UPSERT_BATCH))
+    if batch_size <= 0:
+        raise SystemExit(f"UPSERT_BATCH must be a positive integer, got {batch_size}")
+    batches = chunked(map(schedule_to_record, address_data), batch_size)
+    upsert_batches(
+        supabase,
+        table,
+        (part for batch in batches for part in split_oversized(batch)),
+    )
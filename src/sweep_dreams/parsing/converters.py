@@ -2,6 +2,7 @@
 
 from collections import defaultdict
 from datetime import time
+from operator import attrgetter
 
 from sweep_dreams.domain.models import (
     BlockKey,
@@ -13,6 +14,9 @@ from sweep_dreams.domain.models import (
     _WEEKDAY_LOOKUP,
 )
 
+# Reads (week1, ..., week5) from a SweepingSchedule in one call.
+_WEEK_FLAGS = attrgetter("week1", "week2", "week3", "week4", "week5")
+
 
 def block_key_from_schedule(schedule: SweepingSchedule) -> BlockKey:
     """Build a BlockKey from a SweepingSchedule."""
@@ -68,7 +72,11 @@ def sweeping_schedules_to_blocks(
             weekday = _WEEKDAY_LOOKUP.get(sched.week_day.lower())
             if weekday is None:
                 continue
-            weeks = {i for i in range(1, 6) if getattr(sched, f"week{i}")} or None
+            weeks = {
+                week
+                for week, active in enumerate(_WEEK_FLAGS(sched), start=1)
+                if active
+            } or None
 
             rule = RecurringRule(
                 pattern=MonthlyPattern(
@@ -83,22 +91,23 @@ def sweeping_schedules_to_blocks(
             )
             rules.append(rule)
 
-        # Merge rules with identical patterns (optional optimization)
-        merged_rules: list[RecurringRule] = []
+        # Merge rules with identical patterns (optional optimization), indexed by
+        # the fields that must match: time window, weeks of month, holidays.
+        merged_by_key: dict[tuple, RecurringRule] = {}
         for rule in rules:
-            # Try to merge into an existing rule
-            for existing in merged_rules:
-                same_time = existing.time_window == rule.time_window
-                same_weeks = (
-                    existing.pattern.weeks_of_month == rule.pattern.weeks_of_month
-                )
-                same_holidays = existing.skip_holidays == rule.skip_holidays
-
-                if same_time and same_weeks and same_holidays:
-                    existing.pattern.weekdays |= rule.pattern.weekdays
-                    break
+            weeks = rule.pattern.weeks_of_month
+            key = (
+                rule.time_window.start,
+                rule.time_window.end,
+                frozenset(weeks) if weeks is not None else None,
+                rule.skip_holidays,
+            )
+            existing = merged_by_key.get(key)
+            if existing is not None:
+                existing.pattern.weekdays |= rule.pattern.weekdays
             else:
-                merged_rules.append(rule)
+                merged_by_key[key] = rule
+        merged_rules = list(merged_by_key.values())
 
         # Skip blocks with no valid rules (e.g., holiday-only blocks)
         if merged_rules:
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from sweep_dreams.domain.models import SweepingSchedule
+from sweep_dreams.domain.models import SCHEDULE_LIST_ADAPTER, SweepingSchedule
 
 
 def feature_to_dict(feature: dict[str, Any]) -> dict[str, Any]:
@@ -47,15 +47,15 @@ def parse_schedules(data: dict[str, Any]) -> list[SweepingSchedule]:
     Args:
         data (dict[str, Any]): The GeoJSON payload to parse.
     """
-    schedules: list[SweepingSchedule] = []
+    records: list[dict[str, Any]] = []
     for feature in data.get("features", []):
         geometry = feature.get("geometry", {})
         if not geometry or not geometry.get("coordinates", None):
             # Skip rows with empty coordinates
             continue
 
-        record = feature_to_dict(feature)
-        schedule = SweepingSchedule(**record)
-        schedules.append(schedule)
+        records.append(feature_to_dict(feature))
 
-    return schedules
+    # Validate the whole page in one pydantic-core call instead of one
+    # SweepingSchedule(**record) per feature.
+    return SCHEDULE_LIST_ADAPTER.validate_python(records)
@@ -0,0 +1,79 @@
+"""Shared HTTP session setup for the Supabase repositories."""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# Connections kept alive per host. Requests' default of 10 makes concurrent
+# callers sharing a repository open (and drop) extra TLS connections.
+POOL_MAXSIZE = 20
+
+
+# Retries must never stall a synchronous ETL or API call for long: backoff and
+# any server-sent Retry-After are both capped at this many seconds.
+MAX_RETRY_WAIT_SECONDS = 2.0
+
+# Replaying these cannot apply a change twice.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After only up to MAX_RETRY_WAIT_SECONDS."""
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_WAIT_SECONDS)
+
+
+def _retry_policy(methods: frozenset[str]) -> Retry:
+    """
+    Retry transient rejections of `methods` with short, jittered exponential backoff.
+
+    Connection errors (nothing was sent), 429 (rate limited) and 503 (database
+    unavailable) are retried. A proxy can return 503 after the database ran the
+    request, so only methods that are safe to replay are listed. Read timeouts
+    and other 5xx responses are never retried.
+    """
+    return _CappedRetry(
+        total=3,
+        connect=3,
+        read=0,
+        status=3,
+        backoff_factor=0.05,
+        backoff_jitter=0.025,
+        backoff_max=MAX_RETRY_WAIT_SECONDS,
+        status_forcelist=[429, 503],
+        allowed_methods=methods,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def build_session(
+    api_key: str, *, retry_methods: frozenset[str] = IDEMPOTENT_METHODS
+) -> requests.Session:
+    """Create a keep-alive session with a pooled adapter and Supabase auth headers.
+
+    Args:
+        api_key: Supabase key sent as `apikey` and bearer token.
+        retry_methods: HTTP methods whose transient failures are retried. Add a
+            write verb only if every request the session sends with it is read-only.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_retry_policy(retry_methods),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "apikey": api_key,
+            "Authorization": f"Bearer {api_key}",
+            "Accept": "application/json",
+        }
+    )
+    return session
@@ -5,13 +5,14 @@ from enum import Enum
 from typing import Optional
 
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from sweep_dreams.repositories.exceptions import (
     RepositoryAuthenticationError,
     RepositoryConnectionError,
     SubscriptionNotFoundError,
 )
+from sweep_dreams.repositories.session import build_session
 
 
 class SubscriptionType(str, Enum):
@@ -44,7 +45,12 @@ class SubscriptionRecord(BaseModel):
     last_notified_at: Optional[datetime] = None
     created_at: datetime  # Used as "parked_at" time for timing subscriptions
 
-    model_config = {"extra": "ignore"}
+    model_config = {"extra": "ignore", "frozen": True}
+
+
+# Validates a whole PostgREST list payload straight from the raw JSON bytes,
+# skipping the intermediate list of dicts built by response.json().
+_SUBSCRIPTION_LIST_ADAPTER = TypeAdapter(list[SubscriptionRecord])
 
 
 class SupabaseSubscriptionRepository:
@@ -52,14 +58,7 @@ class SupabaseSubscriptionRepository:
 
     def __init__(self, settings: SupabaseSubscriptionSettings):
         self.settings = settings
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "apikey": settings.key,
-                "Authorization": f"Bearer {settings.key}",
-                "Accept": "application/json",
-            }
-        )
+        self.session = build_session(settings.key)
 
     def upsert_subscription(
         self,
@@ -161,8 +160,7 @@ class SupabaseSubscriptionRepository:
             ) from exc
 
         self._raise_for_errors(response, "listing subscriptions")
-        payload = response.json() or []
-        return [SubscriptionRecord.model_validate(item) for item in payload]
+        return _SUBSCRIPTION_LIST_ADAPTER.validate_json(response.content or b"[]")
 
     def mark_notified(
         self,
@@ -5,12 +5,22 @@ from typing import Any
 import requests
 from pydantic import BaseModel
 
-from sweep_dreams.domain.models import ParkingRegulation, SweepingSchedule
+from sweep_dreams.domain.models import (
+    SCHEDULE_LIST_ADAPTER,
+    ParkingRegulation,
+    SweepingSchedule,
+)
 from sweep_dreams.repositories.exceptions import (
     ScheduleNotFoundError,
     RepositoryConnectionError,
     RepositoryAuthenticationError,
 )
+from sweep_dreams.repositories.session import IDEMPOTENT_METHODS, build_session
+
+# Coordinates sent to the proximity RPC are snapped to this many decimals (~1 m)
+# so GPS jitter maps to repeatable RPC inputs. Coarser grids could straddle a
+# street and change which side the RPC reports as the user's.
+COORDINATE_DECIMALS = 5
 
 
 class SupabaseSettings(BaseModel):
@@ -35,13 +45,9 @@ class SupabaseScheduleRepository:
 
     def __init__(self, settings: SupabaseSettings):
         self.settings = settings
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "apikey": settings.key,
-                "Authorization": f"Bearer {settings.key}",
-                "Accept": "application/json",
-            }
+        # The only POST this repository sends is the read-only proximity RPC.
+        self.session = build_session(
+            settings.key, retry_methods=IDEMPOTENT_METHODS | {"POST"}
         )
 
     def closest_schedules(
@@ -62,7 +68,10 @@ class SupabaseScheduleRepository:
             RepositoryAuthenticationError: If authentication fails
             ScheduleNotFoundError: If no schedules found near location
         """
-        body = {"lon": longitude, "lat": latitude}
+        body = {
+            "lon": round(longitude, COORDINATE_DECIMALS),
+            "lat": round(latitude, COORDINATE_DECIMALS),
+        }
         try:
             response = self.session.post(
                 self.settings.rpc_endpoint, json=body, timeout=(5, 10)
@@ -79,13 +88,12 @@ class SupabaseScheduleRepository:
         if not response.ok:
             raise RepositoryConnectionError(f"Database error: {response.text}")
 
-        payload: list[dict[str, Any]] = response.json()
-        if not payload:
+        # validate_json parses the raw bytes directly, skipping response.json().
+        schedules = SCHEDULE_LIST_ADAPTER.validate_json(response.content)
+        if not schedules:
             raise ScheduleNotFoundError("No schedule found near location")
 
-        valid_payload = [SweepingSchedule.model_validate(item) for item in payload]
-
-        return valid_payload
+        return schedules
 
     def get_schedule_by_block_sweep_id(self, block_sweep_id: int) -> SweepingSchedule:
         """Fetch a single schedule by its block_sweep_id."""
@@ -133,14 +141,7 @@ class SupabaseParkingRegulationRepository:
 
     def __init__(self, settings: SupabaseParkingRegulationSettings):
         self.settings = settings
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "apikey": settings.key,
-                "Authorization": f"Bearer {settings.key}",
-                "Accept": "application/json",
-            }
-        )
+        self.session = build_session(settings.key)
 
     def get_by_id(self, regulation_id: int) -> ParkingRegulation:
         """Fetch a single parking regulation by its ID."""
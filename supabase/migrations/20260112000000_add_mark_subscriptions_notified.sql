@@ -0,0 +1,31 @@
+-- Migration: Bulk-mark subscriptions as notified in a single round-trip
+--
+-- The notification sweep used to PATCH last_notified_at once per sent push.
+-- This function applies a whole batch of marks with one UPDATE ... FROM.
+-- (A PostgREST upsert would need every NOT NULL column for the insert path.)
+
+CREATE OR REPLACE FUNCTION public.mark_subscriptions_notified(marks jsonb)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE public.subscriptions AS s
+    SET last_notified_at = m.notified_at
+    FROM jsonb_to_recordset(marks) AS m(
+        device_token text,
+        schedule_block_sweep_id integer,
+        notified_at timestamptz
+    )
+    WHERE s.device_token = m.device_token
+      AND s.schedule_block_sweep_id = m.schedule_block_sweep_id;
+
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$;
+
+-- Bulk updates are for the notify worker only: keep the RPC off the public API.
+REVOKE ALL ON FUNCTION public.mark_subscriptions_notified(jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.mark_subscriptions_notified(jsonb) TO service_role;
@@ -0,0 +1,14 @@
+-- Migration: Index subscriptions by (subscription_type, last_notified_at)
+--
+-- The notifier only fetches subscriptions that still need a push:
+--   subscription_type = 'timing'   AND last_notified_at IS NULL
+--   subscription_type = 'sweeping' AND (last_notified_at IS NULL OR last_notified_at < cutoff)
+-- A composite index lets those filters skip rows that were just notified
+-- instead of scanning every subscription of the type.
+
+CREATE INDEX IF NOT EXISTS subscriptions_type_last_notified_idx
+ON public.subscriptions (subscription_type, last_notified_at);
+
+-- The composite index leads with subscription_type, so it also serves every
+-- lookup the single-column index did.
+DROP INDEX IF EXISTS public.subscriptions_type_idx;
@@ -0,0 +1,129 @@
+import json
+import threading
+import time
+
+import pytest
+
+from sweep_dreams.etl.schedules_etl import chunked, split_oversized, upsert_batches
+
+
+class FakeTable:
+    def __init__(self, client: "FakeClient") -> None:
+        self.client = client
+
+    def upsert(self, batch):
+        return FakeUpsert(self.client, batch)
+
+
+class FakeUpsert:
+    def __init__(self, client: "FakeClient", batch) -> None:
+        self.client = client
+        self.batch = batch
+
+    def execute(self) -> None:
+        client = self.client
+        with client.lock:
+            client.in_flight += 1
+            client.max_in_flight = max(client.max_in_flight, client.in_flight)
+        time.sleep(0.01)
+        with client.lock:
+            client.in_flight -= 1
+            client.upserted.append(self.batch)
+        if self.batch == client.fail_on:
+            raise RuntimeError("upsert failed")
+
+
+class FakeClient:
+    def __init__(self, fail_on=None) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.upserted: list = []
+        self.table_threads: list[threading.Thread] = []
+        self.fail_on = fail_on
+
+    def table(self, name: str) -> FakeTable:
+        assert name == "schedules"
+        self.table_threads.append(threading.current_thread())
+        return FakeTable(self)
+
+
+def test_chunked_yields_full_chunks_then_the_rest():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+
+
+def test_chunked_consumes_lazily():
+    pulled = []
+
+    def rows():
+        for i in range(10):
+            pulled.append(i)
+            yield i
+
+    chunks = chunked(rows(), 4)
+    assert next(chunks) == [0, 1, 2, 3]
+    assert pulled == [0, 1, 2, 3]
+
+
+def test_split_oversized_keeps_small_batches_whole():
+    batch = [{"id": i} for i in range(5)]
+    assert list(split_oversized(batch, max_bytes=1_000)) == [batch]
+
+
+def test_split_oversized_packs_parts_under_the_cap():
+    batch = [{"id": i, "name": "x" * (i % 7)} for i in range(50)]
+    max_bytes = 120
+
+    parts = list(split_oversized(batch, max_bytes=max_bytes))
+
+    assert [row for part in parts for row in part] == batch
+    assert all(len(json.dumps(part)) <= max_bytes for part in parts)
+    # Parts are filled greedily: the next row would not have fit.
+    for part, following in zip(parts, parts[1:]):
+        assert len(json.dumps(part + following[:1])) > max_bytes
+
+
+def test_split_oversized_sends_an_oversized_row_alone():
+    big = {"id": 1, "name": "x" * 200}
+    batch = [{"id": 0}, big, {"id": 2}]
+
+    assert list(split_oversized(batch, max_bytes=50)) == [
+        [{"id": 0}],
+        [big],
+        [{"id": 2}],
+    ]
+
+
+def test_upsert_batches_bounds_requests_in_flight():
+    client = FakeClient()
+    outstanding = []
+
+    def batches():
+        for i in range(20):
+            # At most max_workers batches are submitted and unfinished when the
+            # next one is pulled.
+            with client.lock:
+                outstanding.append(i - len(client.upserted))
+            yield [{"id": i}]
+
+    upsert_batches(client, "schedules", batches(), max_workers=3)
+
+    assert sorted(batch[0]["id"] for batch in client.upserted) == list(range(20))
+    assert client.max_in_flight <= 3
+    assert max(outstanding) <= 3
+
+
+def test_upsert_batches_resolves_the_table_before_starting_workers():
+    client = FakeClient()
+
+    upsert_batches(client, "schedules", ([{"id": i}] for i in range(8)), max_workers=4)
+
+    assert client.table_threads == [threading.main_thread()]
+
+
+def test_upsert_batches_reraises_a_failed_upsert():
+    client = FakeClient(fail_on=[{"id": 2}])
+
+    with pytest.raises(RuntimeError, match="upsert failed"):
+        upsert_batches(client, "schedules", ([{"id": i}] for i in range(5)))
@@ -0,0 +1,105 @@
+import io
+
+import pytest
+from urllib3 import HTTPResponse
+from urllib3.connectionpool import HTTPConnectionPool
+
+from sweep_dreams.repositories.session import (
+    IDEMPOTENT_METHODS,
+    MAX_RETRY_WAIT_SECONDS,
+    build_session,
+)
+
+URL = "https://example.supabase.co/rest/v1/schedules"
+
+
+class FakeUpstream:
+    """Answers urllib3 requests from a script of (status, headers) pairs."""
+
+    def __init__(self) -> None:
+        self.responses: list[tuple[int, dict[str, str]]] = []
+        self.methods: list[str] = []
+        self.sleeps: list[float] = []
+
+    def respond(self, method: str, url: str) -> HTTPResponse:
+        self.methods.append(method)
+        status, headers = self.responses.pop(0)
+        return HTTPResponse(
+            body=io.BytesIO(b"[]"),
+            status=status,
+            headers=headers,
+            preload_content=False,
+            request_method=method,
+            request_url=url,
+        )
+
+
+@pytest.fixture
+def upstream(monkeypatch) -> FakeUpstream:
+    fake = FakeUpstream()
+
+    def make_request(pool, conn, method, url, **kwargs):
+        return fake.respond(method, url)
+
+    # Stand in below urllib3's retry loop, so the real Retry policy runs.
+    monkeypatch.setattr(HTTPConnectionPool, "_make_request", make_request)
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", fake.sleeps.append)
+    return fake
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_get_retries_transient_rejections(upstream, status):
+    upstream.responses = [(status, {}), (status, {}), (200, {})]
+
+    response = build_session("key").get(URL)
+
+    assert response.status_code == 200
+    assert upstream.methods == ["GET", "GET", "GET"]
+
+
+@pytest.mark.parametrize("method", ["POST", "PATCH", "DELETE"])
+def test_writes_are_not_replayed(upstream, method):
+    upstream.responses = [(503, {})]
+
+    response = build_session("key").request(method, URL)
+
+    assert response.status_code == 503
+    assert upstream.methods == [method]
+
+
+def test_opted_in_post_is_retried(upstream):
+    upstream.responses = [(503, {}), (200, {})]
+    session = build_session("key", retry_methods=IDEMPOTENT_METHODS | {"POST"})
+
+    response = session.post(URL, json={})
+
+    assert response.status_code == 200
+    assert upstream.methods == ["POST", "POST"]
+
+
+def test_other_server_errors_are_not_retried(upstream):
+    upstream.responses = [(500, {})]
+
+    response = build_session("key").get(URL)
+
+    assert response.status_code == 500
+    assert upstream.methods == ["GET"]
+
+
+def test_retry_after_is_capped(upstream):
+    upstream.responses = [(429, {"Retry-After": "3600"}), (200, {})]
+
+    response = build_session("key").get(URL)
+
+    assert response.status_code == 200
+    assert upstream.sleeps == [MAX_RETRY_WAIT_SECONDS]
+
+
+def test_gives_up_after_three_retries(upstream):
+    upstream.responses = [(503, {})] * 4
+
+    response = build_session("key").get(URL)
+
+    assert response.status_code == 503
+    assert len(upstream.methods) == 4
+    assert all(wait <= MAX_RETRY_WAIT_SECONDS for wait in upstream.sleeps)
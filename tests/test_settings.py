@@ -0,0 +1,56 @@
+import pytest
+
+from sweep_dreams.config import settings as settings_module
+from sweep_dreams.config.settings import CORSSettings, get_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings(monkeypatch):
+    # Keep a developer's .env out of the tests; individual tests stand in for it.
+    monkeypatch.setattr(settings_module, "load_dotenv", lambda: False)
+    for name in ("SUPABASE_URL", "SUPABASE_KEY", "CORS_ORIGINS"):
+        monkeypatch.delenv(name, raising=False)
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_cors_from_env_string_drops_empty_origins():
+    cors = CORSSettings.from_env_string(" https://a.example, ,https://b.example,")
+    assert cors.allowed_origins == ["https://a.example", "https://b.example"]
+
+
+@pytest.mark.parametrize("value", ["", " ", ", ,"])
+def test_cors_from_env_string_defaults_to_wildcard(value):
+    assert CORSSettings.from_env_string(value).allowed_origins == ["*"]
+
+
+def test_get_settings_loads_dotenv_before_reading_env(monkeypatch):
+    def fake_load_dotenv():
+        monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+        monkeypatch.setenv("SUPABASE_KEY", "secret")
+        return True
+
+    monkeypatch.setattr(settings_module, "load_dotenv", fake_load_dotenv)
+
+    settings = get_settings()
+
+    assert settings.database.url == "https://example.supabase.co"
+    assert settings.database.key == "secret"
+
+
+def test_get_settings_is_cached_until_cleared(monkeypatch):
+    monkeypatch.setenv("SUPABASE_URL", "https://one.supabase.co")
+    monkeypatch.setenv("SUPABASE_KEY", "secret")
+    first = get_settings()
+
+    monkeypatch.setenv("SUPABASE_URL", "https://two.supabase.co")
+    assert get_settings() is first
+
+    get_settings.cache_clear()
+    assert get_settings().database.url == "https://two.supabase.co"
+
+
+def test_get_settings_requires_credentials():
+    with pytest.raises(RuntimeError):
+        get_settings()
@@ -9,6 +9,7 @@ type Bindings = {
   FCM_PROJECT_ID?: string;
   NOTIFY_CADENCE_MINUTES?: string;
   NOTIFY_DRY_RUN?: string;
+  NOTIFY_CONCURRENCY?: string;
   NOTIFY_RUN_TOKEN?: string;
 };
 
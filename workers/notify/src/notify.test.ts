@@ -0,0 +1,81 @@
+import { describe, it, expect } from 'vitest';
+import { shouldSendSweeping } from './notify';
+import type { SweepingSchedule, SubscriptionRecord } from '../../shared/models';
+
+// Weekly Monday 8am-10am Pacific sweep.
+const schedule: SweepingSchedule = {
+  cnn: 123,
+  corridor: 'Main St',
+  limits: '100-200',
+  cnn_right_left: 'R',
+  block_side: 'E',
+  full_name: 'Mon 8am-10am',
+  week_day: 'Mon',
+  from_hour: 8,
+  to_hour: 10,
+  week1: true,
+  week2: true,
+  week3: true,
+  week4: true,
+  week5: true,
+  holidays: false,
+  block_sweep_id: 456,
+  line: [[-122.4194, 37.7749]],
+  line_geojson: { type: 'LineString', coordinates: [[-122.4194, 37.7749]] },
+};
+
+function record(overrides: Partial<SubscriptionRecord>): SubscriptionRecord {
+  return {
+    device_token: 'a'.repeat(25),
+    platform: 'ios',
+    schedule_block_sweep_id: 456,
+    lead_minutes: 60,
+    subscription_type: 'sweeping',
+    last_notified_at: null,
+    created_at: '2026-01-01T00:00:00Z',
+    ...overrides,
+  };
+}
+
+describe('shouldSendSweeping', () => {
+  it('sends the next weekly notification at the ideal time', () => {
+    const decision = shouldSendSweeping({
+      // Notified for the previous Monday at 7am Pacific.
+      record: record({ last_notified_at: '2026-01-05T15:00:00Z' }),
+      schedule,
+      now: new Date('2026-01-12T15:10:00Z'),
+      cadenceMinutes: 60,
+    });
+
+    expect(decision.shouldSend).toBe(true);
+    expect(decision.start?.toISOString()).toBe('2026-01-12T16:00:00.000Z');
+    expect(decision.notifyAt?.toISOString()).toBe('2026-01-12T15:00:00.000Z');
+  });
+
+  it('skips the window scan right after a notification', () => {
+    const decision = shouldSendSweeping({
+      record: record({ last_notified_at: '2026-01-05T15:00:00Z' }),
+      schedule,
+      now: new Date('2026-01-06T20:00:00Z'),
+      cadenceMinutes: 60,
+    });
+
+    // A scanned decision always carries the window it looked at.
+    expect(decision.shouldSend).toBe(false);
+    expect(decision.start).toBeNull();
+  });
+
+  it('still sends when lead_minutes grew after the last notification', () => {
+    // Notified Monday 7am Pacific with a 60 minute lead, then the lead was
+    // raised to a day: the next notification is due Sunday 8am Pacific.
+    const decision = shouldSendSweeping({
+      record: record({ lead_minutes: 1440, last_notified_at: '2026-01-05T15:00:00Z' }),
+      schedule,
+      now: new Date('2026-01-11T16:10:00Z'),
+      cadenceMinutes: 60,
+    });
+
+    expect(decision.shouldSend).toBe(true);
+    expect(decision.notifyAt?.toISOString()).toBe('2026-01-11T16:00:00.000Z');
+  });
+});
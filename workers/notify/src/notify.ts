@@ -11,8 +11,70 @@ type NotifyBindings = {
   FCM_PROJECT_ID?: string;
   NOTIFY_CADENCE_MINUTES?: string;
   NOTIFY_DRY_RUN?: string;
+  NOTIFY_CONCURRENCY?: string;
 };
 
+// Cron runs that land on the same isolate reuse one client instead of rebuilding it.
+let cachedSupabase: { key: string; client: SupabaseClient } | null = null;
+
+function getSupabaseClient(env: NotifyBindings): SupabaseClient {
+  const cacheKey = `${env.SUPABASE_URL}:${env.SUPABASE_KEY}`;
+  if (!cachedSupabase || cachedSupabase.key !== cacheKey) {
+    cachedSupabase = {
+      key: cacheKey,
+      client: new SupabaseClient({ url: env.SUPABASE_URL, key: env.SUPABASE_KEY }),
+    };
+  }
+  return cachedSupabase.client;
+}
+
+// Workers allow only six simultaneous outbound connections per invocation;
+// anything above that just queues inside the runtime.
+const DEFAULT_SEND_CONCURRENCY = 6;
+
+function parseConcurrency(value: string | undefined): number {
+  const parsed = Number.parseInt((value || '').trim(), 10);
+  return Number.isFinite(parsed) && parsed > 0 ? parsed : DEFAULT_SEND_CONCURRENCY;
+}
+
+/**
+ * Run `worker` over `items` with at most `limit` calls in flight.
+ */
+async function runWithConcurrency<T>(
+  items: T[],
+  limit: number,
+  worker: (item: T) => Promise<void>,
+): Promise<void> {
+  let next = 0;
+  const lanes = Array.from({ length: Math.min(limit, items.length) }, async () => {
+    while (next < items.length) {
+      const item = items[next++];
+      await worker(item);
+    }
+  });
+  await Promise.all(lanes);
+}
+
+// One week minus an hour of slack for DST transitions.
+const MIN_NOTIFY_SPACING_MS = (7 * 24 - 1) * 60 * 60_000;
+
+type PendingPush = {
+  record: SubscriptionRecord;
+  notifyAt: Date;
+  title: string;
+  body: string;
+  data: Record<string, string>;
+};
+
+function logProcessingFailure(record: SubscriptionRecord, err: unknown): void {
+  console.error('Failed to process subscription', {
+    device_token: record.device_token,
+    schedule_block_sweep_id: record.schedule_block_sweep_id,
+    subscription_type: record.subscription_type,
+    err,
+  });
+}
+
 function parseCadenceMinutes(value: string | undefined): number {
   const parsed = Number.parseInt((value || '').trim(), 10);
   return Number.isFinite(parsed) && parsed > 0 ? parsed : 60;
@@ -47,13 +109,28 @@ function buildSweepingNotification(
   };
 }
 
-function shouldSendSweeping(params: {
+export function shouldSendSweeping(params: {
   record: SubscriptionRecord;
   schedule: SweepingSchedule;
   now: Date;
   cadenceMinutes: number;
 }): { shouldSend: boolean; start: Date | null; end: Date | null; notifyAt: Date | null } {
   const { record, schedule, now, cadenceMinutes } = params;
+  const lastNotified = parseDateOrNull(record.last_notified_at ?? null);
+
+  // A schedule row sweeps on a single weekday, so its windows are at least a week
+  // apart. The last notification went out no later than its window's start, so
+  // the next window starts at least MIN_NOTIFY_SPACING_MS after it, and its notify
+  // time at least that minus the current lead. lead_minutes can change without
+  // resetting last_notified_at, so bound by the current lead, not the old one.
+  // If that notify time is still in the future, skip the calendar scan entirely.
+  if (
+    lastNotified &&
+    lastNotified.getTime() > now.getTime() - MIN_NOTIFY_SPACING_MS + record.lead_minutes * 60_000
+  ) {
+    return { shouldSend: false, start: null, end: null, notifyAt: null };
+  }
+
   const [start, end] = nextSweepWindow(schedule, now);
 
   if (start.getTime() <= now.getTime()) {
@@ -61,7 +138,6 @@ function shouldSendSweeping(params: {
   }
 
   const notifyAtIdeal = new Date(start.getTime() - record.lead_minutes * 60_000);
-  const lastNotified = parseDateOrNull(record.last_notified_at ?? null);
 
   // Already notified for this sweep window
   if (lastNotified && lastNotified.getTime() >= notifyAtIdeal.getTime()) {
@@ -78,42 +154,28 @@ function shouldSendSweeping(params: {
   return { shouldSend: false, start, end, notifyAt: null };
 }
 
-export async function runNotificationSweep(env: NotifyBindings): Promise<{
-  sent: number;
-  skipped: number;
-  dry_run: boolean;
+/**
+ * Phase 1: load sweeping subscriptions and every schedule they reference.
+ */
+async function loadSweepTargets(supabase: SupabaseClient): Promise<{
+  records: SubscriptionRecord[];
+  schedulesById: Map<number, SweepingSchedule>;
 }> {
-  const cadenceMinutes = parseCadenceMinutes(env.NOTIFY_CADENCE_MINUTES);
-  const now = new Date();
-
-  const supabase = new SupabaseClient({
-    url: env.SUPABASE_URL,
-    key: env.SUPABASE_KEY,
-  });
-
-  const rawSa = (env.FCM_SERVICE_ACCOUNT_JSON || '').trim();
-  const dryRun = shouldDryRun(env.NOTIFY_DRY_RUN) || !rawSa;
-
-  const serviceAccount = rawSa ? loadServiceAccountFromEnv(rawSa, env.FCM_PROJECT_ID) : null;
-  const accessToken = serviceAccount && !dryRun ? await getFcmAccessToken(serviceAccount) : '';
-
-  console.log('Starting notification sweep', { now: now.toISOString(), cadenceMinutes, dryRun });
-
   const subscriptions = await supabase.listSubscriptions();
 
   // Filter to sweeping subscriptions only - timing handled by Durable Objects in API worker
-  const sweepingSubscriptions = subscriptions.filter(
+  const records = subscriptions.filter(
     (s) => s.subscription_type !== 'timing'
   );
 
   console.log('Fetched subscriptions', {
     total: subscriptions.length,
-    sweeping: sweepingSubscriptions.length,
-    timing_skipped: subscriptions.length - sweepingSubscriptions.length,
+    sweeping: records.length,
+    timing_skipped: subscriptions.length - records.length,
   });
 
   const sweepingIds = new Set<number>();
-  for (const record of sweepingSubscriptions) {
+  for (const record of records) {
     sweepingIds.add(record.schedule_block_sweep_id);
   }
 
@@ -123,10 +185,23 @@ export async function runNotificationSweep(env: NotifyBindings): Promise<{
     for (const s of schedules) schedulesById.set(s.block_sweep_id, s);
   }
 
-  let sent = 0;
+  return { records, schedulesById };
+}
+
+/**
+ * Phase 2 (CPU only): decide which subscriptions need a push right now.
+ */
+function computePendingPushes(params: {
+  records: SubscriptionRecord[];
+  schedulesById: Map<number, SweepingSchedule>;
+  now: Date;
+  cadenceMinutes: number;
+}): { pending: PendingPush[]; skipped: number } {
+  const { records, schedulesById, now, cadenceMinutes } = params;
+  const pending: PendingPush[] = [];
   let skipped = 0;
 
-  for (const record of sweepingSubscriptions) {
+  for (const record of records) {
     try {
       const schedule = schedulesById.get(record.schedule_block_sweep_id);
       if (!schedule) {
@@ -140,10 +215,61 @@ export async function runNotificationSweep(env: NotifyBindings): Promise<{
         continue;
       }
 
-      const { title, body, data } = buildSweepingNotification(record, schedule, decision.start, decision.end);
+      pending.push({
+        record,
+        notifyAt: decision.notifyAt || now,
+        ...buildSweepingNotification(record, schedule, decision.start, decision.end),
+      });
+    } catch (err) {
+      logProcessingFailure(record, err);
+      skipped += 1;
+    }
+  }
+
+  return { pending, skipped };
+}
+
+// Successful pushes are marked in chunks of this size while dispatch is still
+// running, so a failed RPC or a cut-off run leaves at most one chunk unmarked.
+const MARK_FLUSH_SIZE = 50;
+
+type NotifiedMark = { device_token: string; schedule_block_sweep_id: number; notified_at: string };
+
+/**
+ * Phase 3 (I/O only): send pushes concurrently, recording them in batches as they complete.
+ */
+async function dispatchPushes(params: {
+  supabase: SupabaseClient;
+  pending: PendingPush[];
+  accessToken: string;
+  projectId: string;
+  dryRun: boolean;
+  concurrency: number;
+}): Promise<{ sent: number; failed: number }> {
+  const { supabase, pending, accessToken, projectId, dryRun, concurrency } = params;
+  let marks: NotifiedMark[] = [];
+  const flushes: Promise<void>[] = [];
+  let sent = 0;
+  let failed = 0;
+
+  // Record buffered pushes with one batched update instead of a PATCH per send.
+  // A failed flush is logged, not thrown: it must not discard the other batches.
+  const flushMarks = () => {
+    if (marks.length === 0) return;
+    const batch = marks;
+    marks = [];
+    flushes.push(
+      supabase.markNotifiedBulk(batch).catch((err) => {
+        console.error('Failed to mark subscriptions notified', { count: batch.length, err });
+      }),
+    );
+  };
+
+  await runWithConcurrency(pending, concurrency, async ({ record, notifyAt, title, body, data }) => {
+    try {
       await sendPushV1({
         accessToken,
-        projectId: serviceAccount?.projectId || '',
+        projectId,
         deviceToken: record.device_token,
         title,
         body,
@@ -152,25 +278,67 @@ export async function runNotificationSweep(env: NotifyBindings): Promise<{
       });
 
       if (!dryRun) {
-        await supabase.markNotified(
-          record.device_token,
-          record.schedule_block_sweep_id,
-          (decision.notifyAt || now).toISOString(),
-        );
+        marks.push({
+          device_token: record.device_token,
+          schedule_block_sweep_id: record.schedule_block_sweep_id,
+          notified_at: notifyAt.toISOString(),
+        });
+        if (marks.length >= MARK_FLUSH_SIZE) flushMarks();
       }
 
       sent += 1;
     } catch (err) {
-      console.error('Failed to process subscription', {
-        device_token: record.device_token,
-        schedule_block_sweep_id: record.schedule_block_sweep_id,
-        subscription_type: record.subscription_type,
-        err,
-      });
-      skipped += 1;
+      logProcessingFailure(record, err);
+      failed += 1;
     }
-  }
+  });
+
+  flushMarks();
+  await Promise.all(flushes);
+
+  return { sent, failed };
+}
+
+export async function runNotificationSweep(env: NotifyBindings): Promise<{
+  sent: number;
+  skipped: number;
+  dry_run: boolean;
+}> {
+  const cadenceMinutes = parseCadenceMinutes(env.NOTIFY_CADENCE_MINUTES);
+  const now = new Date();
+
+  const supabase = getSupabaseClient(env);
+
+  const rawSa = (env.FCM_SERVICE_ACCOUNT_JSON || '').trim();
+  const dryRun = shouldDryRun(env.NOTIFY_DRY_RUN) || !rawSa;
+
+  const serviceAccount = rawSa ? loadServiceAccountFromEnv(rawSa, env.FCM_PROJECT_ID) : null;
+
+  console.log('Starting notification sweep', { now: now.toISOString(), cadenceMinutes, dryRun });
+
+  // The OAuth token and the Supabase reads are independent; fetch them together.
+  const [accessToken, { records, schedulesById }] = await Promise.all([
+    serviceAccount && !dryRun ? getFcmAccessToken(serviceAccount) : Promise.resolve(''),
+    loadSweepTargets(supabase),
+  ]);
+
+  const { pending, skipped: notDue } = computePendingPushes({
+    records,
+    schedulesById,
+    now,
+    cadenceMinutes,
+  });
+
+  const { sent, failed } = await dispatchPushes({
+    supabase,
+    pending,
+    accessToken,
+    projectId: serviceAccount?.projectId || '',
+    dryRun,
+    concurrency: parseConcurrency(env.NOTIFY_CONCURRENCY),
+  });
 
+  const skipped = notDue + failed;
   console.log('Notification sweep done', { sent, skipped, dryRun });
   return { sent, skipped, dry_run: dryRun };
 }
@@ -182,6 +182,55 @@ describe('Calendar Logic', () => {
       const now = new Date('2025-01-01T08:00:00Z'); // Jan 1, 2025 00:00 Pacific
       expect(() => nextSweepWindow(schedule, now)).toThrow('no active weeks');
     });
+
+    describe('window cache', () => {
+      // 1st Monday 8am-10am Pacific: Jan 6, 2025 16:00Z-18:00Z.
+      const schedule: SweepingSchedule = {
+        cnn: 123,
+        corridor: 'Main St',
+        limits: '100-200',
+        cnn_right_left: 'R',
+        block_side: 'E',
+        full_name: 'Mon 1st 8am-10am',
+        week_day: 'Mon',
+        from_hour: 8,
+        to_hour: 10,
+        week1: true,
+        week2: false,
+        week3: false,
+        week4: false,
+        week5: false,
+        holidays: false,
+        block_sweep_id: 456,
+        line: [[-122.4194, 37.7749]],
+        line_geojson: { type: 'LineString', coordinates: [[-122.4194, 37.7749]] },
+      };
+
+      it('returns fresh copies of the cached window within the same hour', () => {
+        const [start, end] = nextSweepWindow(schedule, new Date('2025-01-06T16:10:00Z'));
+        start.setTime(0);
+        end.setTime(0);
+
+        // Same rule on another block, later in the same hour.
+        const [again, againEnd] = nextSweepWindow(
+          { ...schedule, block_sweep_id: 789 },
+          new Date('2025-01-06T16:50:00Z'),
+        );
+        expect(again.toISOString()).toBe('2025-01-06T16:00:00.000Z');
+        expect(againEnd.toISOString()).toBe('2025-01-06T18:00:00.000Z');
+        expect(again).not.toBe(start);
+      });
+
+      it('recomputes the window when the hour rolls over', () => {
+        const [start] = nextSweepWindow(schedule, new Date('2025-01-06T17:30:00Z'));
+        expect(start.toISOString()).toBe('2025-01-06T16:00:00.000Z');
+
+        // The Jan 6 window ends at 18:00Z, so the next one is Feb 3.
+        const [next, nextEnd] = nextSweepWindow(schedule, new Date('2025-01-06T18:00:00Z'));
+        expect(next.toISOString()).toBe('2025-02-03T16:00:00.000Z');
+        expect(nextEnd.toISOString()).toBe('2025-02-03T18:00:00.000Z');
+      });
+    });
   });
 
   describe('nextSweepWindowFromRule', () => {
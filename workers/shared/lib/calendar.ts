@@ -122,6 +122,12 @@ export function nextSweepWindowFromRule(
   throw new Error('Unable to compute next sweep window within 12 months.');
 }
 
+const HOUR_MS = 60 * 60 * 1000;
+
+// Schedule windows for the hour bucket in windowCacheHour, as [startMs, endMs].
+const windowCache = new Map<string, [number, number]>();
+let windowCacheHour = -1;
+
 /**
  * Compute the next sweep window for a raw SweepingSchedule.
  * Port of Python's next_sweep_window().
@@ -135,7 +141,6 @@ export function nextSweepWindow(
   now?: Date,
 ): [Date, Date] {
   const reference = now || new Date();
-  const referencePacific = getPacificDateParts(reference);
 
   const weekdayLabel = (schedule.week_day || '').trim().toLowerCase();
   if (weekdayLabel === 'holiday') {
@@ -159,13 +164,28 @@ export function nextSweepWindow(
     throw new Error('Schedule has no active weeks configured.');
   }
 
+  // Windows start and end on whole hours, so every reference time within one
+  // hour yields the same window: serve repeats from a cache for the current hour.
+  const hourBucket = Math.floor(reference.getTime() / HOUR_MS);
+  if (hourBucket !== windowCacheHour) {
+    windowCache.clear();
+    windowCacheHour = hourBucket;
+  }
+  const cacheKey = `${weekday}|${activeWeeks.join(',')}|${schedule.from_hour}|${schedule.to_hour}`;
+  const cached = windowCache.get(cacheKey);
+  if (cached) {
+    return [new Date(cached[0]), new Date(cached[1])];
+  }
+
+  const referencePacific = getPacificDateParts(reference);
+
   // Search up to 13 months ahead
   for (let monthOffset = 0; monthOffset < 13; monthOffset++) {
     const monthIndex = (referencePacific.month - 1) + monthOffset;
     const year = referencePacific.year + Math.floor(monthIndex / 12);
     const month = (monthIndex % 12) + 1;
 
-    for (const occurrence of activeWeeks.sort((a, b) => a - b)) {
+    for (const occurrence of activeWeeks) {
       const day = nthWeekday(year, month, weekday, occurrence);
       if (day === null) continue;
 
@@ -181,6 +201,7 @@ export function nextSweepWindow(
       if (endDt <= reference) continue;
 
       if (startDt <= reference || startDt > reference) {
+        windowCache.set(cacheKey, [startDt.getTime(), endDt.getTime()]);
         return [startDt, endDt];
       }
     }
@@ -209,6 +230,22 @@ function parseMilitaryTime(militaryTime: number): [number, number] {
   return [hours, minutes];
 }
 
+// Intl formatters are expensive to construct; build once and reuse.
+const PACIFIC_WEEKDAY_FORMATTER = new Intl.DateTimeFormat('en-US', {
+  timeZone: PACIFIC_TZ,
+  weekday: 'short',
+});
+
+const PACIFIC_DATE_PARTS_FORMATTER = new Intl.DateTimeFormat('en-US', {
+  timeZone: PACIFIC_TZ,
+  year: 'numeric',
+  month: '2-digit',
+  day: '2-digit',
+  hour: '2-digit',
+  minute: '2-digit',
+  hour12: false,
+});
+
 /**
  * Get the JavaScript weekday (0=Sunday) from a Date in Pacific time.
  *
@@ -216,11 +253,7 @@ function parseMilitaryTime(militaryTime: number): [number, number] {
  * @returns JavaScript weekday (0=Sunday, 6=Saturday)
  */
 function getPacificWeekday(date: Date): number {
-  const formatter = new Intl.DateTimeFormat('en-US', {
-    timeZone: PACIFIC_TZ,
-    weekday: 'short',
-  });
-  const weekdayStr = formatter.format(date).toLowerCase();
+  const weekdayStr = PACIFIC_WEEKDAY_FORMATTER.format(date).toLowerCase();
 
   const jsWeekdayMap: Record<string, number> = {
     'sun': 0,
@@ -241,17 +274,7 @@ function getPacificWeekday(date: Date): number {
  * @returns Object with year, month (1-12), day, hour, minute
  */
 function getPacificDateParts(date: Date): { year: number; month: number; day: number; hour: number; minute: number } {
-  const formatter = new Intl.DateTimeFormat('en-US', {
-    timeZone: PACIFIC_TZ,
-    year: 'numeric',
-    month: '2-digit',
-    day: '2-digit',
-    hour: '2-digit',
-    minute: '2-digit',
-    hour12: false,
-  });
-
-  const parts = formatter.formatToParts(date);
+  const parts = PACIFIC_DATE_PARTS_FORMATTER.formatToParts(date);
   const getValue = (type: string) => parseInt(parts.find(p => p.type === type)?.value || '0', 10);
 
   return {
@@ -12,6 +12,14 @@ export type LoadedServiceAccount = {
 
 const FCM_SCOPE = 'https://www.googleapis.com/auth/firebase.messaging';
 const OAUTH_TOKEN_URL = 'https://oauth2.googleapis.com/token';
+// Refresh cached tokens this long before Google says they expire.
+const TOKEN_REFRESH_MARGIN_MS = 5 * 60 * 1000;
+
+// Access tokens live for an hour; keep them for the lifetime of the isolate so
+// back-to-back cron runs and test pushes skip the JWT signing + OAuth round-trip.
+const cachedTokens = new Map<string, { token: string; expiresAtMs: number }>();
+// Importing the RSA key is the expensive part of minting a token; do it once per key.
+const cachedSigningKeys = new Map<string, Promise<CryptoKey>>();
 
 function isTruthy(value: string | undefined): boolean {
   if (!value) return false;
@@ -76,7 +84,15 @@ async function signJwtRs256(privateKey: CryptoKey, payload: Record<string, unkno
   return `${signingInput}.${signaturePart}`;
 }
 
+// The secret never changes within an isolate, so parse it once and reuse it.
+let cachedServiceAccount: { key: string; value: LoadedServiceAccount } | null = null;
+
 export function loadServiceAccountFromEnv(rawEnvValue: string, explicitProjectId?: string): LoadedServiceAccount {
+  const cacheKey = `${explicitProjectId || ''}:${rawEnvValue}`;
+  if (cachedServiceAccount && cachedServiceAccount.key === cacheKey) {
+    return cachedServiceAccount.value;
+  }
+
   const raw = rawEnvValue.trim();
   const jsonText = raw.startsWith('{') ? raw : decodeBase64ToString(raw);
 
@@ -95,15 +111,27 @@ export function loadServiceAccountFromEnv(rawEnvValue: string, explicitProjectId
   if (!privateKeyPem) throw new Error('Service account missing private_key');
   if (!projectId) throw new Error('Service account missing project_id (or set FCM_PROJECT_ID)');
 
-  return { clientEmail, privateKeyPem, projectId };
+  const loaded = { clientEmail, privateKeyPem, projectId };
+  cachedServiceAccount = { key: cacheKey, value: loaded };
+  return loaded;
 }
 
 export async function getFcmAccessToken(serviceAccount: LoadedServiceAccount): Promise<string> {
+  const cached = cachedTokens.get(serviceAccount.clientEmail);
+  if (cached && cached.expiresAtMs - TOKEN_REFRESH_MARGIN_MS > Date.now()) {
+    return cached.token;
+  }
+
   const iat = Math.floor(Date.now() / 1000);
   const exp = iat + 3600;
 
-  const pkcs8 = pemToPkcs8(serviceAccount.privateKeyPem);
-  const key = await importRsaPrivateKey(pkcs8);
+  let keyPromise = cachedSigningKeys.get(serviceAccount.privateKeyPem);
+  if (!keyPromise) {
+    keyPromise = importRsaPrivateKey(pemToPkcs8(serviceAccount.privateKeyPem));
+    keyPromise.catch(() => cachedSigningKeys.delete(serviceAccount.privateKeyPem));
+    cachedSigningKeys.set(serviceAccount.privateKeyPem, keyPromise);
+  }
+  const key = await keyPromise;
 
   const jwt = await signJwtRs256(key, {
     iss: serviceAccount.clientEmail,
@@ -128,9 +156,15 @@ export async function getFcmAccessToken(serviceAccount: LoadedServiceAccount): P
     throw new Error(`Google OAuth token error ${response.status}: ${text}`);
   }
 
-  const data = await response.json() as { access_token?: string };
+  const data = await response.json() as { access_token?: string; expires_in?: number };
   const token = (data.access_token || '').trim();
   if (!token) throw new Error('Google OAuth token response missing access_token');
+
+  const expiresInSeconds = typeof data.expires_in === 'number' ? data.expires_in : exp - iat;
+  cachedTokens.set(serviceAccount.clientEmail, {
+    token,
+    expiresAtMs: iat * 1000 + expiresInSeconds * 1000,
+  });
   return token;
 }
 
@@ -168,6 +202,10 @@ export async function sendPushV1(params: {
     const text = await response.text();
     throw new Error(`FCM error ${response.status}: ${text}`);
   }
+
+  // The success body (the message name) is unused: discard it without buffering
+  // so the connection is released immediately for the next send.
+  await response.body?.cancel();
 }
 
 export function shouldDryRun(envValue: string | undefined): boolean {
@@ -3,17 +3,20 @@ import { Weekday } from '../models';
 
 const PACIFIC_TZ = 'America/Los_Angeles';
 
+// Intl formatters are expensive to construct; build once and reuse.
+const PACIFIC_CLOCK_FORMATTER = new Intl.DateTimeFormat('en-US', {
+  timeZone: PACIFIC_TZ,
+  hour: 'numeric',
+  minute: '2-digit',
+  hour12: true,
+});
+
 /**
  * Format a Date as a clock time string in Pacific timezone.
  * Example: "2:30 PM"
  */
 export function formatPacificClockTime(date: Date): string {
-  return new Intl.DateTimeFormat('en-US', {
-    timeZone: PACIFIC_TZ,
-    hour: 'numeric',
-    minute: '2-digit',
-    hour12: true,
-  }).format(date);
+  return PACIFIC_CLOCK_FORMATTER.format(date);
 }
 
 const WEEKDAY_NAMES: Record<Weekday, string> = {
@@ -318,26 +318,28 @@ export class SupabaseClient {
   }
 
   /**
-   * Mark a subscription as notified by setting last_notified_at.
+   * Mark many subscriptions as notified with one RPC call per batch.
    */
-  async markNotified(deviceToken: string, scheduleBlockSweepId: number, notifiedAtIso: string): Promise<void> {
-    const url = `${this.url}/rest/v1/subscriptions?device_token=eq.${encodeURIComponent(deviceToken)}&schedule_block_sweep_id=eq.${scheduleBlockSweepId}`;
-
-    const response = await fetch(url, {
-      method: 'PATCH',
-      headers: {
-        'apikey': this.key,
-        'Authorization': `Bearer ${this.key}`,
-        'Content-Type': 'application/json',
-        'Accept': 'application/json',
-        'Prefer': 'return=minimal',
-      },
-      body: JSON.stringify({ last_notified_at: notifiedAtIso }),
-    });
+  async markNotifiedBulk(
+    marks: { device_token: string; schedule_block_sweep_id: number; notified_at: string }[],
+  ): Promise<void> {
+    for (let i = 0; i < marks.length; i += 500) {
+      const response = await fetch(`${this.url}/rest/v1/rpc/mark_subscriptions_notified`, {
+        method: 'POST',
+        headers: {
+          'apikey': this.key,
+          'Authorization': `Bearer ${this.key}`,
+          'Content-Type': 'application/json',
+          'Accept': 'application/json',
+          'Prefer': 'return=minimal',
+        },
+        body: JSON.stringify({ marks: marks.slice(i, i + 500) }),
+      });
 
-    if (!response.ok) {
-      const text = await response.text();
-      throw new Error(`Supabase update error ${response.status}: ${text}`);
+      if (!response.ok) {
+        const text = await response.text();
+        throw new Error(`Supabase update error ${response.status}: ${text}`);
+      }
     }
   }
 
@@ -21,6 +21,8 @@ app.use('/*', cors({
   origin: '*',  // TODO: Restrict to your domains in production
   allowMethods: ['GET', 'POST', 'DELETE', 'HEAD', 'OPTIONS'],
   allowHeaders: ['Content-Type', 'Authorization'],
+  // The policy is static; let browsers reuse a preflight result for a day.
+  maxAge: 86400,
 }));
 
 // Health check
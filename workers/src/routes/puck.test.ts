@@ -1,6 +1,6 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import { Hono } from 'hono';
-import puck from './puck';
+import puck, { clearScheduleCache } from './puck';
 import type { SweepingSchedule } from '../../shared/models';
 import type { ParkingRegulation } from '../../shared/models/parking';
 
@@ -28,6 +28,7 @@ describe('Puck Endpoint', () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    clearScheduleCache();
   });
 
   it('prefers user-side schedule and returns nearest regulation', async () => {
@@ -160,4 +161,113 @@ describe('Puck Endpoint', () => {
     const body = await res.json() as any;
     expect(body.regulation).toBeNull();
   });
+  it('tags responses with an ETag and answers a matching If-None-Match with 304', async () => {
+    mockFetch.mockImplementation((url: string) => {
+      if (url.includes('/rest/v1/rpc/schedules_near_closest_block')) {
+        return Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve([]),
+        });
+      }
+      if (url.includes('/rest/v1/rpc/parking_regulation_nearest')) {
+        return Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve([]),
+        });
+      }
+      return Promise.reject(new Error(`Unexpected URL: ${url}`));
+    });
+
+    const url = 'http://localhost/api/check-puck?latitude=37.7749&longitude=-122.4194';
+
+    const first = await app.fetch(new Request(url), env);
+    expect(first.status).toBe(200);
+    const etag = first.headers.get('ETag');
+    expect(etag).toBeTruthy();
+
+    const second = await app.fetch(
+      new Request(url, { headers: { 'If-None-Match': etag! } }),
+      env,
+    );
+    expect(second.status).toBe(304);
+    expect(second.headers.get('ETag')).toBe(etag);
+    expect(await second.text()).toBe('');
+  });
+
+  describe('schedule cache', () => {
+    const scheduleRpc = '/rest/v1/rpc/schedules_near_closest_block';
+
+    afterEach(() => {
+      vi.restoreAllMocks();
+    });
+
+    function mockRpcs(scheduleOk: () => boolean = () => true) {
+      mockFetch.mockImplementation((url: string) => {
+        if (url.includes(scheduleRpc)) {
+          const ok = scheduleOk();
+          return Promise.resolve({
+            ok,
+            status: ok ? 200 : 500,
+            text: () => Promise.resolve('boom'),
+            json: () => Promise.resolve([]),
+          });
+        }
+        if (url.includes('/rest/v1/rpc/parking_regulation_nearest')) {
+          return Promise.resolve({
+            ok: true,
+            json: () => Promise.resolve([]),
+          });
+        }
+        return Promise.reject(new Error(`Unexpected URL: ${url}`));
+      });
+    }
+
+    function scheduleRpcCalls(): number {
+      return mockFetch.mock.calls.filter(([url]) => String(url).includes(scheduleRpc)).length;
+    }
+
+    function check(latitude = 37.7749, longitude = -122.4194) {
+      return app.fetch(
+        new Request(`http://localhost/api/check-puck?latitude=${latitude}&longitude=${longitude}`),
+        env,
+      );
+    }
+
+    it('reuses the schedule lookup for the same coordinates', async () => {
+      mockRpcs();
+
+      await check();
+      // Differs only past the quantization precision, so it hits the same cell.
+      await check(37.774900001, -122.419400001);
+      expect(scheduleRpcCalls()).toBe(1);
+
+      await check(37.7750, -122.4194);
+      expect(scheduleRpcCalls()).toBe(2);
+    });
+
+    it('refetches once the cached lookup expires', async () => {
+      mockRpcs();
+      const start = Date.parse('2026-01-12T16:00:00Z');
+      const now = vi.spyOn(Date, 'now').mockReturnValue(start);
+
+      await check();
+      now.mockReturnValue(start + 4 * 60_000);
+      await check();
+      expect(scheduleRpcCalls()).toBe(1);
+
+      now.mockReturnValue(start + 5 * 60_000 + 1);
+      await check();
+      expect(scheduleRpcCalls()).toBe(2);
+    });
+
+    it('does not cache a failed lookup', async () => {
+      let failures = 1;
+      mockRpcs(() => failures-- <= 0);
+
+      await check();
+      await check();
+      await check();
+      expect(scheduleRpcCalls()).toBe(2);
+    });
+  });
 });
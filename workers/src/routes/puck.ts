@@ -1,4 +1,5 @@
 import { Hono } from 'hono';
+import { etag } from 'hono/etag';
 import { z } from 'zod';
 import { zValidator } from '@hono/zod-validator';
 import { SupabaseClient } from '../../shared/supabase';
@@ -21,6 +22,60 @@ const puckSchema = z.object({
   radius: z.coerce.number().min(1).max(500).optional(),
 });
 
+// Schedule rows only change with the ETL, so nearby lookups are cached per isolate.
+// Coordinates are snapped to 5 decimals (~1 m): coarser cells could straddle a
+// street and flip which side the RPC reports as the user's.
+const SCHEDULE_CACHE_TTL_MS = 5 * 60_000;
+const SCHEDULE_CACHE_MAX_ENTRIES = 1000;
+const COORDINATE_DECIMALS = 5;
+
+// Entries hold the in-flight promise so concurrent requests for the same cell
+// share one RPC instead of stampeding Supabase.
+const scheduleCache = new Map<string, { expiresAtMs: number; value: Promise<SweepingSchedule[]> }>();
+
+/**
+ * Drop every cached schedule lookup. The cache lives for the whole isolate, so
+ * tests call this to keep cases independent.
+ */
+export function clearScheduleCache(): void {
+  scheduleCache.clear();
+}
+
+function quantizeCoordinate(value: number): number {
+  return Number(value.toFixed(COORDINATE_DECIMALS));
+}
+
+function cachedClosestSchedules(
+  client: SupabaseClient,
+  latitude: number,
+  longitude: number,
+): Promise<SweepingSchedule[]> {
+  const lat = quantizeCoordinate(latitude);
+  const lon = quantizeCoordinate(longitude);
+  const key = `${lat},${lon}`;
+  const nowMs = Date.now();
+
+  const cached = scheduleCache.get(key);
+  if (cached && cached.expiresAtMs > nowMs) {
+    return cached.value;
+  }
+
+  if (scheduleCache.size >= SCHEDULE_CACHE_MAX_ENTRIES) {
+    // Maps iterate in insertion order, so the first key is the oldest entry.
+    const oldest = scheduleCache.keys().next().value;
+    if (oldest !== undefined) scheduleCache.delete(oldest);
+  }
+
+  const value = client.closestSchedules(lat, lon);
+  scheduleCache.delete(key);
+  scheduleCache.set(key, { expiresAtMs: nowMs + SCHEDULE_CACHE_TTL_MS, value });
+  // Never cache failures.
+  value.catch(() => {
+    if (scheduleCache.get(key)?.value === value) scheduleCache.delete(key);
+  });
+  return value;
+}
+
 const METERS_TO_FEET = 3.28084;
 const FEET_PER_MILE = 5280;
 const FEET_THRESHOLD = 1000;
@@ -239,6 +294,8 @@ function formatScheduleSide(result: SideResult) {
 
 puck.get(
   '/check-puck',
+  // Repeat polls of an unchanged result get a bodiless 304 via If-None-Match.
+  etag(),
   zValidator('query', puckSchema),
   async (c) => {
     c.header('Cache-Control', 'public, max-age=10, stale-while-revalidate=60');
@@ -256,7 +313,7 @@ puck.get(
 
     const schedulesPromise: Promise<SweepingSchedule[] | null> = (async () => {
       try {
-        return await scheduleClient.closestSchedules(latitude, longitude);
+        return await cachedClosestSchedules(scheduleClient, latitude, longitude);
       } catch (e) {
         scheduleError = e instanceof Error ? e.message : String(e);
         return null;